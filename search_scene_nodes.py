@@ -10,6 +10,7 @@ except ModuleNotFoundError:
 import maya.OpenMayaUI as omui
 import maya.cmds as cmds
 import sys
+from typing import Optional
 
 
 def maya_main_window() -> QtWidgets.QWidget:
@@ -26,8 +27,10 @@ class SearchSceneNodes(QtWidgets.QDialog):
 	NO_NODETYPE: str = ""
 	last_sel_node_type: str = NO_NODETYPE
 	
-	ALL_NODETYPES: list[str] = cmds.allNodeTypes()
-	NODETYPES_DISPLAY: list[str] = [NO_NODETYPE] + ALL_NODETYPES
+	# Queried from maya on first ui creation, see load_node_types
+	NODETYPES_DISPLAY: Optional[tuple[str, ...]] = None
+	
+	FILTER_DELAY_MS: int = 120
 	
 	ui_instance = None
 	
@@ -50,6 +53,20 @@ class SearchSceneNodes(QtWidgets.QDialog):
 			cls.ui_instance.activateWindow()
 	
 	
+	@classmethod
+	def load_node_types(cls, force: bool = False) -> None:
+		"""
+		Queries maya's node types for the node type combo box, only done once 
+			unless forced so importing the module has no maya side effects
+		
+		:param force: bool - re query the node types even if already loaded
+		
+		:return: None
+		"""
+		if cls.NODETYPES_DISPLAY is None or force:
+			cls.NODETYPES_DISPLAY = (cls.NO_NODETYPE,) + tuple(cmds.allNodeTypes() or ())
+	
+	
 	def __init__(self) -> None:
 		"""
 		Initialize the inherited class and create the ui
@@ -64,8 +81,26 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		if sys.platform == "darwin":
 			self.setWindowFlag(QtCore.Qt.Tool, True)
 		
-		self.scene_nodes = cmds.ls()
-		#self.scene_shapes = cmds.ls(shapes=True)
+		self.load_node_types()
+		
+		# The only scene query during initialization
+		self.scene_nodes = cmds.ls() or []
+		# Shapes are only queried once exclude shapes is checked
+		self._scene_shapes_set: Optional[set[str]] = None
+		
+		# Coalesces rapid keystrokes in the search field into one filter pass
+		self._filter_timer = QtCore.QTimer(self)
+		self._filter_timer.setSingleShot(True)
+		self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+		self._applied_filter_string = ""
+		self._displayed_nodes: list[str] = []
+		
+		# Defers the maya select until control returns to the event loop, so 
+		# selection changes emitted while handling one event, eg. a click 
+		# deselecting and selecting rows, result in a single maya select
+		self._selection_timer = QtCore.QTimer(self)
+		self._selection_timer.setSingleShot(True)
+		self._selection_timer.setInterval(0)
 		
 		self.create_widgets()
 		self.create_connections()
@@ -88,13 +123,34 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		self.nodetype_cb.addItems(self.NODETYPES_DISPLAY)
 		self.nodetype_cb.setEditable(True)
 		self.nodetype_cb.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
-		self.nodetype_cb.completer().setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+		
+		# Completer over a case insensitively sorted model so matching 
+		# node types can be found with a binary search
+		self._nodetype_completer_model = QtCore.QStringListModel(self)
+		self.update_nodetype_completer()
+		
+		nodetype_completer = QtWidgets.QCompleter(self._nodetype_completer_model, self)
+		nodetype_completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+		nodetype_completer.setModelSorting(QtWidgets.QCompleter.CaseInsensitivelySortedModel)
+		nodetype_completer.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+		self.nodetype_cb.setCompleter(nodetype_completer)
 		
 		self.clear_nodetype_btn = QtWidgets.QPushButton("Clear Node Type")
 		self.reload_nodes_btn = QtWidgets.QPushButton("Reload Scene Nodes")
 		
-		self.display_nodes_lw = QtWidgets.QListWidget()
-		self.display_nodes_lw.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+		# Scene nodes model, the search string is filtered by the proxy in Qt
+		self._model = QtCore.QStringListModel(self)
+		self._proxy = QtCore.QSortFilterProxyModel(self)
+		self._proxy.setSourceModel(self._model)
+		self._proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+		
+		self.display_nodes_lv = QtWidgets.QListView()
+		self.display_nodes_lv.setModel(self._proxy)
+		self.display_nodes_lv.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+		self.display_nodes_lv.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+		self.display_nodes_lv.setUniformItemSizes(True)
+		self.display_nodes_lv.setLayoutMode(QtWidgets.QListView.Batched)
+		self.display_nodes_lv.setBatchSize(256)
 	
 	
 	def create_layout(self) -> None:
@@ -115,7 +171,7 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		form_layout = QtWidgets.QFormLayout()
 		form_layout.addRow("Filter node type", nodetype_grid_layout)
 		form_layout.addRow("Search nodes", search_grid_layout)
-		form_layout.addRow(self.display_nodes_lw)
+		form_layout.addRow(self.display_nodes_lv)
 		
 		main_layout = QtWidgets.QVBoxLayout(self)
 		main_layout.addLayout(form_layout)
@@ -127,8 +183,12 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		
 		:return: None
 		"""
-		self.search_le.textChanged.connect(self.update_display_nodes)
-		self.display_nodes_lw.itemSelectionChanged.connect(self.item_selection_changed)
+		self.search_le.textChanged.connect(lambda: self._filter_timer.start())
+		self._filter_timer.timeout.connect(self.update_search_filter)
+		self.display_nodes_lv.selectionModel().selectionChanged.connect(
+			lambda: self._selection_timer.start()
+		)
+		self._selection_timer.timeout.connect(self.item_selection_changed)
 		self.nodetype_cb.currentIndexChanged.connect(self.update_node_type)
 		self.clear_nodetype_btn.clicked.connect(
 			lambda: self.nodetype_cb.setCurrentIndex(0)
@@ -157,22 +217,30 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		:return: None
 		"""
 		self.update_display_nodes()
-		self.reload_scene_nodes()
 
 	
-	def filter_node_type(self, node_type: str) -> None:
+	def filter_node_type(self, node_type: str, force_reload: bool = False) -> None:
 		"""
 		Apply node type filter to all scene nodes
 		
 		:param node_type: str - any valid maya node type
+		:param force_reload: bool - re query the scene even if the node type 
+			hasn't changed
 		
 		:return: None
 		"""
+		# Reselecting the same node type doesn't need another scene query
+		if node_type == self.last_sel_node_type and not force_reload:
+			return
+		
 		if node_type == self.nodetype_cb.itemText(0):
-			self.scene_nodes = cmds.ls()
+			self.scene_nodes = cmds.ls() or []
 				
 		else:
-			self.scene_nodes = cmds.ls(type=node_type)
+			self.scene_nodes = cmds.ls(type=node_type) or []
+		
+		# Shapes may have changed since they were cached, re query them lazily
+		self.clear_scene_shapes()
 		
 		self.update_display_nodes()
 		self.last_sel_node_type = node_type
@@ -184,33 +252,117 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		
 		:return: None
 		"""
-		self.filter_node_type(self.nodetype_cb.currentText())
+		self.filter_node_type(self.nodetype_cb.currentText(), force_reload=True)
 	
 	
-	def update_display_nodes(self) -> None:
+	def reload_node_types(self) -> None:
 		"""
-		Updates the QListWidget in the ui with the filtered nodes
+		Re queries maya's node types, eg. after loading a plugin, and 
+			repopulates the node type combo box keeping the current node type
 		
 		:return: None
 		"""
-		# Get user filter
-		filter_string = self.search_le.text()
+		self.load_node_types(force=True)
 		
-		# Find nodes with matching strings
-		nodes = [
-			node for node in self.scene_nodes if filter_string.lower() in node.lower()
-			]
+		current_node_type = self.nodetype_cb.currentText()
+		
+		self.nodetype_cb.blockSignals(True)
+		self.nodetype_cb.clear()
+		self.nodetype_cb.addItems(self.NODETYPES_DISPLAY)
+		self.update_nodetype_completer()
+		
+		# Falls back to no node type if the current one no longer exists
+		index = max(self.nodetype_cb.findText(current_node_type), 0)
+		self.nodetype_cb.setCurrentIndex(index)
+		self.nodetype_cb.blockSignals(False)
+		
+		self.filter_node_type(self.nodetype_cb.itemText(index))
+	
+	
+	def update_nodetype_completer(self) -> None:
+		"""
+		Fills the node type completer with the node types sorted case 
+			insensitively, as its model sorting expects
+		
+		:return: None
+		"""
+		self._nodetype_completer_model.setStringList(
+			sorted(
+				(node_type for node_type in self.NODETYPES_DISPLAY if node_type),
+				key=str.lower
+			)
+		)
+	
+	
+	def clear_scene_shapes(self) -> None:
+		"""
+		Clears the cached scene shape nodes so they are re queried the next 
+			time the exclude shapes filter is applied
+		
+		:return: None
+		"""
+		self._scene_shapes_set = None
+	
+	
+	def get_scene_shapes(self) -> set[str]:
+		"""
+		Returns the cached scene shape nodes, querying maya only if needed
+		
+		:return: set[str]
+		"""
+		if self._scene_shapes_set is None:
+			self._scene_shapes_set = set(cmds.ls(shapes=True) or [])
+		
+		return self._scene_shapes_set
+	
+	
+	def update_display_nodes(self) -> None:
+		"""
+		Updates the list model in the ui with the scene nodes, excluding 
+			shapes if the box is checked
+		
+		:return: None
+		"""
+		nodes = self.scene_nodes
 		
 		# Get rid of shape nodes if the box is checked
 		if self.no_shapes_checkbox.isChecked():
-			scene_shapes = cmds.ls(shapes=True)
+			scene_shapes = self.get_scene_shapes()
 			nodes = [
 				node for node in nodes if node not in scene_shapes
 			]
 		
-		# Clear and re add new nodes
-		self.display_nodes_lw.clear()
-		self.display_nodes_lw.addItems(nodes)
+		# Only reset the model when the nodes actually changed, the proxy 
+		# already updates rows incrementally for search changes and a reset 
+		# would rebuild the view and drop the user's selection
+		if nodes == self._displayed_nodes:
+			return
+		
+		# Resetting the model shouldn't re select nodes in maya
+		with QtCore.QSignalBlocker(self.display_nodes_lv.selectionModel()):
+			self._model.setStringList(nodes)
+		
+		self._displayed_nodes = nodes
+	
+	
+	def update_search_filter(self) -> None:
+		"""
+		Applies the user search string to the displayed nodes
+		
+		:return: None
+		"""
+		filter_string = self.search_le.text()
+		
+		# Skip re filtering the proxy when the search didn't actually change,
+		# eg. typing and deleting a character before the debounce fires
+		if filter_string == self._applied_filter_string:
+			return
+		
+		# Filtering out selected rows shouldn't re select nodes in maya
+		with QtCore.QSignalBlocker(self.display_nodes_lv.selectionModel()):
+			self._proxy.setFilterFixedString(filter_string)
+		
+		self._applied_filter_string = filter_string
 	
 	
 	def item_selection_changed(self) -> None:
@@ -219,13 +371,21 @@ class SearchSceneNodes(QtWidgets.QDialog):
 		
 		:return: None
 		"""
-		cmds.select(
-			[
-				item.text() 
-				for item in self.display_nodes_lw.selectedItems() 
-				if cmds.objExists(item.text())
-			]
-		)
+		selected_names = [
+			index.data() 
+			for index in self.display_nodes_lv.selectionModel().selectedIndexes()
+		]
+		if not selected_names:
+			cmds.select(clear=True)
+			return
+		
+		# One ls call filters out nodes that no longer exist
+		existing_nodes = cmds.ls(selected_names)
+		if not existing_nodes:
+			cmds.select(clear=True)
+			return
+		
+		cmds.select(existing_nodes, replace=True)
 
 
 if __name__ == "__main__":
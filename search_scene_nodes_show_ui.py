@@ -2,5 +2,4 @@ import sys
 sys.path.append(r"your_file_path")
 import search_scene_nodes
 
-search_scene_nodes_win = search_scene_nodes.SearchSceneNodes()
-search_scene_nodes_win.show_ui()
\ No newline at end of file
+search_scene_nodes.SearchSceneNodes.show_ui()
\ No newline at end of file